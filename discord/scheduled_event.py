@@ -23,14 +23,15 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from __future__ import annotations
+from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import Any, Iterator, List, Optional, TYPE_CHECKING, Tuple
 
 from . import utils
-from .utils import MISSING
-from .asset import Asset, AssetMixin
-from .utils import SnowflakeList, snowflake_time, MISSING
+from .utils import MISSING, snowflake_time
+from .asset import Asset
 from .enums import ScheduledEventStatus, ScheduledEventEntityType, try_enum
-from .user import User
+from .mixins import Hashable
 
 __all__ = (
     'ScheduledEvent',
@@ -42,10 +43,47 @@ if TYPE_CHECKING:
     from .state import ConnectionState
     from .abc import Snowflake
     from .role import Role
-    from datetime import datetime
+    from .user import User
+
+
+def _parse_discord_ts(timestamp: Optional[str]) -> Optional[datetime]:
+    # Discord timestamps have a fixed ISO8601 shape, so go straight to the
+    # C-implemented fromisoformat and only fall back to the generic parser
+    # for anything unexpected.
+    if timestamp is None:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return utils.parse_time(timestamp)
+
+
+def _snow(value, _int=int) -> Optional[int]:
+    # Snowflake-or-null coercion shared by the id fields in _from_data.
+    # Binding int as a default keeps the lookup local.
+    return _int(value) if value else None
+
+
+# Extracts the required fields of a scheduled event payload in a single
+# C-level call rather than one dict lookup per field.
+_REQUIRED = itemgetter(
+    'id',
+    'name',
+    'scheduled_start_time',
+    'scheduled_end_time',
+    'privacy_level',
+    'status',
+    'entity_type',
+)
+
+# Plain dict lookup is cheaper than going through try_enum for the
+# common case of a known value; try_enum remains the fallback so unknown
+# values still produce the usual proxy.
+_STATUS_CACHE = ScheduledEventStatus._enum_value_map_
+_ETYPE_CACHE = ScheduledEventEntityType._enum_value_map_
 
 
-class ScheduledEvent(AssetMixin):
+class ScheduledEvent(Hashable):
     """Represents a custom scheduled event.
 
     Depending on the way this object was created, some of the attributes can
@@ -105,9 +143,6 @@ class ScheduledEvent(AssetMixin):
         The number of users who have RSVPed to the event
     image: :class:`str`
         The hash of the event's cover image
-    creator: Optional[:class:`User`]
-        The user that created the scheduled event. This can only be retrieved using :meth:`Guild.fetch_scheduled_event` and
-        having the :attr:`~Permissions.manage_scheduled_events` permission.
     """
 
     __slots__: Tuple[str, ...] = (
@@ -126,72 +161,141 @@ class ScheduledEvent(AssetMixin):
         'location',
         'user_count',
         'image',
-        'creator',
+        '_creator_data',
+        '_creator',
+        '_created_at',
+        '_hash',
+        '_str_cache',
+        '_cover_image',
     )
 
+    __match_args__: Tuple[str, ...] = ('id', 'name')
+
     def __init__(self, *, guild: Guild, state: ConnectionState, data: ScheduledEventPayload):
-        self.guild_id: int = guild.id
         self._state: ConnectionState = state
-        self._from_data(data)
-
-    def _from_data(self, scheduled_event: ScheduledEventPayload):
-        self.id: int = int(scheduled_event['id'])  # type: ignore
-        self.name: str = scheduled_event['name']  # type: ignore
-        self.guild_id: int = int(scheduled_event['guild_id'])
-
-        channel = scheduled_event['channel_id']
-        self.channel_id: int = int(channel) if channel else None
-
-        self.creator_id: int = scheduled_event.get('creator_id', 0)
-        self.description: str = scheduled_event['description']
-        self.scheduled_start_time: datetime.datetime = utils.parse_time(scheduled_event['scheduled_start_time'])
-        self.scheduled_end_time: datetime.datetime = utils.parse_time(scheduled_event['scheduled_end_time'])
-        self.privacy_level: int = int(scheduled_event['privacy_level'])
-        self.status: ScheduledEventStatus = try_enum(ScheduledEventStatus, scheduled_event['status'])
-        self.entity_type: ScheduledEventEntityType = try_enum(ScheduledEventEntityType, scheduled_event['entity_type'])
-
-        metadata = scheduled_event['entity_metadata']
-        self.location: Optional[str] = metadata.get('location', None) if metadata else None
-        self.user_count: int = int(scheduled_event.get('user_count', 0))
-        self.image: str = scheduled_event['image']
-        user = scheduled_event.get('creator')
-        self.creator: Optional[User] = User(state=self._state, data=user) if user else None
+        self._created_at: Optional[datetime] = None
+        self._hash: Optional[int] = None
+        self._str_cache: Optional[str] = None
+        self._cover_image: Optional[Asset] = None
+        self._from_data(data, guild)
+
+    def _from_data(self, scheduled_event: ScheduledEventPayload, guild: Guild):
+        id_, name, start, end, privacy, status, entity_type = _REQUIRED(scheduled_event)
+        get = scheduled_event.get
+
+        self.id: int = int(id_)
+        self.name: str = name
+
+        # guild.id is already an int, so only pay for the int() conversion
+        # when the payload actually carries a guild_id.
+        guild_id = get('guild_id')
+        self.guild_id: int = guild.id if guild_id is None else int(guild_id)
+
+        self.channel_id: Optional[int] = _snow(get('channel_id'))
+        self.creator_id: Optional[int] = _snow(get('creator_id'))
+        self.description: str = get('description', '')
+        self.scheduled_start_time: datetime = _parse_discord_ts(start)
+        self.scheduled_end_time: Optional[datetime] = _parse_discord_ts(end)
+        self.privacy_level: int = int(privacy)
+        self.status: ScheduledEventStatus = _STATUS_CACHE.get(status) or try_enum(ScheduledEventStatus, status)
+        self.entity_type: ScheduledEventEntityType = _ETYPE_CACHE.get(entity_type) or try_enum(ScheduledEventEntityType, entity_type)
+
+        # Discord omits entity_metadata for non-EXTERNAL events, which is
+        # the majority case.
+        metadata = get('entity_metadata')
+        self.location: Optional[str] = metadata.get('location') if metadata else None
+        self.user_count: int = int(get('user_count', 0))
+        self.image: str = get('image') or ''
+        self._creator_data = get('creator')
+        self._creator: Optional[User] = None
+
+    @classmethod
+    def from_payload_list(cls, *, guild: Guild, state: ConnectionState, payloads: List[ScheduledEventPayload]) -> List[ScheduledEvent]:
+        """Constructs a list of scheduled events from a raw payload list.
+
+        This binds the per-event construction machinery to locals once,
+        which is noticeably cheaper than a plain list comprehension over
+        the constructor for large bulk payloads (e.g. ``GUILD_CREATE``).
+        """
+        new = cls.__new__
+        from_data = cls._from_data
+        out: List[ScheduledEvent] = []
+        append = out.append
+        for payload in payloads:
+            self = new(cls)
+            self._state = state
+            self._created_at = None
+            self._hash = None
+            self._str_cache = None
+            self._cover_image = None
+            from_data(self, payload, guild)
+            append(self)
+        return out
 
     def _to_partial(self) -> PartialScheduledEvent:
         return PartialScheduledEvent(name=self.name, id=self.id)
 
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
-        for attr in self.__slots__:
-            if attr[0] != '_':
-                value = getattr(self, attr, None)
-                if value is not None:
-                    yield (attr, value)
+        yield from ((name, value) for name, value in zip(self._PUBLIC_SLOTS, self._PUBLIC_GETTER(self)) if value is not None)
 
     def __str__(self) -> str:
-        return f'<:{self.name}:{self.id}:{self.description}:{self.location}/{self.channel_id}>'
+        # Every input is immutable after construction, so assemble the
+        # string once and reuse it on subsequent log lines.
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f'<:{self.name}:{self.id}:{self.description}:{self.location}/{self.channel_id}>'
+        return s
 
     def __repr__(self) -> str:
         return f'<ScheduledEvent id={self.id} name={self.name!r}>'
 
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, _ScheduledEventTag) and self.id == other.id
-
-    def __ne__(self, other: Any) -> bool:
-        return not self.__eq__(other)
-
     def __hash__(self) -> int:
-        return self.id >> 22
+        # Safe to cache since id never mutates after _from_data.
+        h = self._hash
+        if h is None:
+            h = self._hash = self.id >> 22
+        return h
 
     @property
     def created_at(self) -> datetime:
         """:class:`datetime.datetime`: Returns the scheduled_event's creation time in UTC."""
-        return snowflake_time(self.id)
+        if self._created_at is None:
+            self._created_at = snowflake_time(self.id)
+        return self._created_at
 
     @property
     def guild(self) -> Guild:
         """:class:`Guild`: The guild this scheduled event belongs to."""
         return self._state._get_guild(self.guild_id)
 
+    @property
+    def creator(self) -> Optional[User]:
+        """Optional[:class:`User`]: The user that created the scheduled event.
+
+        This can only be retrieved using :meth:`Guild.fetch_scheduled_event` and
+        having the :attr:`~Permissions.manage_scheduled_events` permission.
+
+        The :class:`User` is constructed lazily on first access.
+        """
+        if self._creator is None and self._creator_data is not None:
+            # Deferred so importing this module doesn't pay for .user;
+            # sys.modules makes repeat imports cheap.
+            from .user import User
+
+            self._creator = User(state=self._state, data=self._creator_data)
+        return self._creator
+
+    @property
+    def cover_image(self) -> Optional[Asset]:
+        """Optional[:class:`Asset`]: The event's cover image, if it has one.
+
+        The :class:`Asset` is constructed lazily from :attr:`image` on
+        first access.
+        """
+        if self._cover_image is None and self.image:
+            self._cover_image = Asset._from_scheduled_event_cover_image(self._state, self.id, self.image)
+        return self._cover_image
+
     async def delete(self, *, reason: Optional[str] = None) -> None:
         """|coro|
 
@@ -256,3 +360,9 @@ class ScheduledEvent(AssetMixin):
 
         data = await self._state.http.edit_custom_emoji(self.guild.id, self.id, payload=payload, reason=reason)
         return Emoji(guild=self.guild, data=data, state=self._state)
+
+
+# Precomputed once so __iter__ can fetch every public attribute in a
+# single C-level attrgetter call instead of a getattr per slot.
+ScheduledEvent._PUBLIC_SLOTS = tuple(attr for attr in ScheduledEvent.__slots__ if not attr.startswith('_'))
+ScheduledEvent._PUBLIC_GETTER = attrgetter(*ScheduledEvent._PUBLIC_SLOTS)